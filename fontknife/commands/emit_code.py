@@ -13,9 +13,11 @@ def main(font: RasterFont, output: PathLike, output_args: Mapping[str, Any]):
 
     :param font: Raster font data to write.
     :param output: A path or '-' indicating where to write output to.
-    :param output_args: Prefix-stripped args to pass to emit_octo.
+    :param output_args: Prefix-stripped args to pass to emit_octo. An
+                        absent glyph_sequence is passed as None, so
+                        emit_octo falls back to the font's glyphs.
     :return:
     """
     with ExitStack() as output_streams:
         output_stream = output_streams.enter_context(StdOrFile(output, 'w')).raw
-        emit_octo(output_stream, font, output_args['glyph_sequence'])
+        emit_octo(output_stream, font, output_args.get('glyph_sequence'))
@@ -232,23 +232,21 @@ def _validate_and_unpack_bbox_like_args(
 class CompareByLenAndElementsMixin:
     """
     Ease compatibility when comparing against other sequences.
-    """
-
-    def __eq__(self: SequenceLike, other: SequenceLike) -> bool:
-        if other is None:
-            return False
 
-        len_self = len(self)
+    Sequences of a different length compare as unequal rather than
+    raising, so instances are safe to use as keys in mixed containers.
+    """
 
-        if len(other) != len_self:
-            raise ValueError(
-                f"Invalid comparison: Bounding boxes must be sequence-like of"
-                f" length 4, but got {other}")
+    # These return NotImplemented for non-sequences, hence the Any
+    def __eq__(self: SequenceLike, other: Any) -> Any:
+        try:
+            return len(self) == len(other) and tuple(self) == tuple(other)
+        except TypeError:
+            return NotImplemented
 
-        for i in range(len_self):
-            if self[i] != other[i]:
-                return False
-        return True
+    def __ne__(self: SequenceLike, other: Any) -> Any:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
 
 class HashAsTupleMixin:
@@ -291,6 +289,29 @@ class BboxFancy(HashAsTupleMixin, CompareByLenAndElementsMixin, tuple):
         args = _validate_and_unpack_bbox_like_args((0, 0), args)
         return super(BboxFancy, cls).__new__(cls, args)
 
+    @classmethod
+    def _from_four_ints(cls, left: int, top: int, right: int, bottom: int) -> BboxFancy:
+        """
+        Build an instance from edge values without argument dispatch.
+
+        This skips the unwrapping and prefixing done by ``__new__`` for
+        the common case of per-glyph bounding boxes. Negative values are
+        still rejected.
+
+        :param left: The left edge.
+        :param top: The top edge.
+        :param right: The right edge.
+        :param bottom: The bottom edge.
+        :return:
+        """
+        if left < 0 or top < 0 or right < 0 or bottom < 0:
+            raise ValueError(
+                f"All values must be >= 0, but {(left, top, right, bottom)!r} contains negatives")
+
+        bbox = tuple.__new__(cls, (left, top, right, bottom))
+        bbox._size = SizeFancy(right - left, bottom - top)
+        return bbox
+
     # __init__ must be overloaded to match __new__ to make
     # autocomplete to work in IDEs such as PyCharm.
     @overload
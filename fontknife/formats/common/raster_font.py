@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from types import MappingProxyType
 from typing import Iterable, Dict, Optional, KeysView, Union, Mapping, Tuple, Protocol
 
@@ -31,13 +32,13 @@ class GlyphMetadata:
     def from_font_glyph(cls, glyph_bbox: BoundingBox, bitmap: ImageCoreLike) -> GlyphMetadata:
 
         # get the stated values
-        glyph_bbox = BboxFancy(*glyph_bbox)
+        glyph_bbox = BboxFancy._from_four_ints(*glyph_bbox)
         bitmap_bbox = None
 
         if bitmap is not None:
             bitmap_bbox = bitmap.getbbox()
             if bitmap_bbox is not None:
-                bitmap_bbox = BboxFancy(*bitmap_bbox)
+                bitmap_bbox = BboxFancy._from_four_ints(*bitmap_bbox)
 
         return cls(
             glyph_bbox=glyph_bbox,
@@ -47,6 +48,56 @@ class GlyphMetadata:
         )
 
 
+def _int_array() -> array:
+    return array('l')
+
+
+@dataclass
+class GlyphMetadataTable:
+    """
+    Glyph metadata stored as parallel columns instead of per-glyph objects.
+
+    Each index in the arrays corresponds to one glyph. This makes
+    aggregates over a whole font, such as the largest right edge, a
+    single call like ``max(table.right)`` instead of an attribute
+    chase through every GlyphMetadata instance.
+    """
+    left: array = field(default_factory=_int_array)
+    top: array = field(default_factory=_int_array)
+    right: array = field(default_factory=_int_array)
+    bottom: array = field(default_factory=_int_array)
+    width: array = field(default_factory=_int_array)
+    height: array = field(default_factory=_int_array)
+    bitmap_len_bytes: array = field(default_factory=_int_array)
+
+    @classmethod
+    def from_glyph_metadata(cls, metadata: Iterable[GlyphMetadata]) -> GlyphMetadataTable:
+        """
+        Fill the columns from glyph metadata in a single pass.
+
+        :param metadata: Metadata for each glyph, in table order.
+        :return:
+        """
+        table = cls()
+        left, top, right, bottom = table.left, table.top, table.right, table.bottom
+        width, height, bitmap_len_bytes = table.width, table.height, table.bitmap_len_bytes
+
+        for glyph_metadata in metadata:
+            glyph_bbox = glyph_metadata.glyph_bbox
+            left.append(glyph_bbox[0])
+            top.append(glyph_bbox[1])
+            right.append(glyph_bbox[2])
+            bottom.append(glyph_bbox[3])
+            width.append(glyph_bbox[2] - glyph_bbox[0])
+            height.append(glyph_bbox[3] - glyph_bbox[1])
+            bitmap_len_bytes.append(glyph_metadata.bitmap_len_bytes)
+
+        return table
+
+    def __len__(self) -> int:
+        return len(self.left)
+
+
 GlyphMaskMapping = Mapping[str, ImageCoreLike]
 GlyphMetadataMapping = Mapping[str, GlyphMetadata]
 
@@ -215,20 +266,10 @@ class RasterFont:
         if not self._glyph_bitmaps:
             return  # Exit early, nothing to do
 
-        # Brute force the maximum tile bounding box.
-        # It doesn't seem worth optimizing right now given the following:
-        #  1. RasterFont objects will not change frequently
-        #  2. This tool is designed for converting retro bitmap fonts
-        #     and generating filler assets.
-        tile_max_bbox = None
-        for glyph, metadata in self._glyph_metadata.items():
-            current = metadata.glyph_bbox
-            if tile_max_bbox is None:
-                tile_max_bbox = current
-            else:
-                tile_max_bbox |= current
-
-        self._max_tile_bbox: BboxFancy = BboxFancy(*tile_max_bbox)
+        # The maximum tile bounding box encloses every glyph's bbox
+        table = GlyphMetadataTable.from_glyph_metadata(self._glyph_metadata.values())
+        self._max_tile_bbox: BboxFancy = BboxFancy(
+            min(table.left), min(table.top), max(table.right), max(table.bottom))
         self._notdef_glyph = generate_missing_character_core(self._max_tile_bbox[:2])
         self._notdef_glyph_metadata = GlyphMetadata.from_font_glyph(self._max_tile_bbox, self._notdef_glyph)
 
@@ -1,4 +1,6 @@
-from typing import Union, Optional, Iterable, Tuple, cast
+from functools import lru_cache
+from pathlib import Path
+from typing import Union, Optional, Iterable, Tuple, Callable, cast
 
 from PIL import ImageFont, ImageDraw, Image
 
@@ -7,7 +9,7 @@ from fontknife.formats import RasterFont, rasterize_font_to_tables
 from fontknife.formats.common import BinaryReader
 from fontknife.formats.common.raster_font import GlyphRasterizerCallable
 from fontknife.graphemes import ASCII_COMMON_SHEET_MEMBERS
-from fontknife.iohelpers import StdOrFile, get_resource_filesystem_path
+from fontknife.iohelpers import StdOrFile, get_resource_filesystem_path, absolute_path
 
 
 def ttf_bbox_and_mask_getter(
@@ -46,6 +48,38 @@ def ttf_bbox_and_mask_getter(
     return bbox, glyph_cropped.im
 
 
+@lru_cache(maxsize=16)
+def _load_truetype_for_file_state(
+    loader: Callable[..., ImageFont.FreeTypeFont],
+    path: str,
+    modified_time_ns: int,
+    size_points: int
+) -> ImageFont.FreeTypeFont:
+    return loader(path, size=size_points)
+
+
+def load_truetype_cached(
+    path: PathLike,
+    size_points: int,
+    loader: Callable[..., ImageFont.FreeTypeFont] = ImageFont.truetype
+) -> ImageFont.FreeTypeFont:
+    """
+    Load a TTF from a file system path, reusing recently loaded faces.
+
+    Faces are cached per loader, absolute path, modification time, and
+    point size. Editing a font file on disk will cause it to be loaded
+    again instead of returning stale data.
+
+    :param path: A file system path to a TTF file.
+    :param size_points: The point size to load the font at.
+    :param loader: The callable to load the font with on a cache miss.
+    :return:
+    """
+    path = absolute_path(path)
+    modified_time_ns = Path(path).stat().st_mtime_ns
+    return _load_truetype_for_file_state(loader, path, modified_time_ns, size_points)
+
+
 class TrueTypeReader(BinaryReader):
     format_name = 'truetype'
     file_extensions = ['ttf']
@@ -60,10 +94,16 @@ class TrueTypeReader(BinaryReader):
         if glyph_sequence is None:  # Attempt to get common characters
             glyph_sequence = ASCII_COMMON_SHEET_MEMBERS
 
-        with StdOrFile(source, 'rb') as wrapped:
-            raw_font = self.__class__.wrapped_callable(
-                wrapped.raw, size=font_size_points)
-            path = get_resource_filesystem_path(source)
+        # Streams can't be cached reliably, so only cache paths
+        if isinstance(source, (str, Path)) and source != '-':
+            raw_font = load_truetype_cached(
+                source, font_size_points, loader=self.__class__.wrapped_callable)
+            path = absolute_path(source)
+        else:
+            with StdOrFile(source, 'rb') as wrapped:
+                raw_font = self.__class__.wrapped_callable(
+                    wrapped.raw, size=font_size_points)
+                path = get_resource_filesystem_path(source)
 
         raw_glyph_data = rasterize_font_to_tables(
             raw_font, glyph_sequence,
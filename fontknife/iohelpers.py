@@ -212,6 +212,10 @@ class OutputHelper:
         self._line_index = 0
         self._column_index = 0
 
+    @property
+    def comment_prefix(self) -> str:
+        return self._comment_prefix
+
     def write(self, s: str) -> None:
         if s == '':
             return
@@ -236,18 +240,7 @@ class OutputHelper:
         self.write("\n")
 
     def print(self, *objects, sep: str = ' ', end: str = '\n') -> None:
-        first = True
-
-        for object_ in objects:
-
-            if first:
-                first = False
-            else:
-                self.write(sep)
-
-            self.write(str(object_))
-
-        self.write(end)
+        self.write(sep.join(map(str, objects)) + end)
 
     def comment(self, *objects, comment_prefix: Optional[str] = None, sep=' ', end='\n') -> None:
         comment_prefix = comment_prefix or self._comment_prefix
@@ -1,11 +1,59 @@
-from collections import deque
-from functools import cache
-from math import log
-from typing import Iterable, Optional
+from functools import cache, lru_cache
+from typing import Iterable, Optional, Sequence
+
+from PIL import Image
 
 from fontknife.formats import RasterFont
-from fontknife.iohelpers import OutputHelper, padded_hex, exit_error
-from fontknife.custom_types import HasWrite
+from fontknife.iohelpers import OutputHelper, exit_error
+from fontknife.custom_types import HasWrite, ImageCoreLike
+
+
+# Octo hex literals for every byte value, matching padded_hex's output
+_HEX = tuple(f"0x{i:02X}" for i in range(256))
+
+# Maps any non-zero pixel value to a set bit when converting to mode '1'.
+# Passing a callable to Image.point instead would rebuild this per call.
+_SET_PIXEL_LUT = (0,) + (255,) * 255
+
+# The drawing routines emit_octo writes before the data tables. It
+# starts with a newline to leave a blank line before the header. The
+# comment prefix and indent come from the OctoStream writing it. One
+# register holds the character for both routines because the drawing
+# routine reuses the width routine's result in place.
+_PREAMBLE_TEMPLATE = """
+{comment}Font: {prefix}  Table glyphs in order: {available_chars}
+
+{comment}Call with {char_reg} = ASCII character, {draw_x_reg} = x, {draw_y_reg} = y
+{comment}Returns with {draw_x_reg} incremented by the width of the glyph plus {kern_px}
+{comment}Clobbers vF, I
+{comment}Must not be called with {char_reg} < {first_glyph} or {char_reg} > {last_glyph}!
+: {prefix}_draw_glyph
+{indent}{char_reg} += {glyph_offset}
+{indent}i := {glyphtable_name}
+{glyph_offset_lines}{indent}sprite {draw_x_reg} {draw_y_reg} {font_height}
+{indent}{prefix}_glyph_width_no_offset
+{indent}{draw_x_reg} += {char_reg}
+{indent}{draw_x_reg} += 1
+{indent}return
+
+{comment}Call with {char_reg} = ASCII character
+{comment}Returns {char_reg} = width of glyph in pixels
+{comment}Clobbers vF, I
+{comment}Must not be called with {char_reg} < {first_glyph} or {char_reg} > {last_glyph}!
+: {prefix}_glyph_width
+{indent}{char_reg} += {glyph_offset}
+: {prefix}_glyph_width_no_offset
+{indent}i := {widthtable_name}
+{indent}i += {char_reg}
+{indent}load {char_reg}
+{indent}return
+: {prefix}draw_str
+"""
+
+
+@lru_cache(maxsize=32)
+def _indent_prefix(indent_chars: str, level: int) -> str:
+    return indent_chars * level
 
 
 class OctoStream(OutputHelper):
@@ -18,11 +66,14 @@ class OctoStream(OutputHelper):
 
         self._indent_level = 0
         self._indent_chars = indent_chars
-        self.byte_queue = deque()
+        self.byte_queue = bytearray()
 
     def print(self, *objects, sep: str = ' ', end: str = '\n') -> None:
-        self.write(self.get_indent_prefix(self._indent_level))
-        super().print(*objects, sep=sep, end=end)
+        self.write(self.get_indent_prefix(self._indent_level) + sep.join(map(str, objects)) + end)
+
+    @property
+    def indent_chars(self) -> str:
+        return self._indent_chars
 
     @property
     def indent_level(self) -> int:
@@ -34,9 +85,8 @@ class OctoStream(OutputHelper):
             raise ValueError("indent_level must be 0 or greater")
         self._indent_level = new_level
 
-    @cache
     def get_indent_prefix(self, level: int) -> str:
-        return self._indent_chars * self._indent_level
+        return _indent_prefix(self._indent_chars, level)
 
     def label(self, label_name: str, end: str = "\n"):
         self.print(f": {label_name}", end=end)
@@ -74,20 +124,64 @@ class OctoStream(OutputHelper):
         label_pad = self.pad_for_label_name(label_name)
 
         byte_queue = self.byte_queue
-        line = 0
-        num_to_pop = max_bytes_per_line
-        while byte_queue:
-            num_to_pop = min(max_bytes_per_line, len(byte_queue))
-            self.print(' '.join((padded_hex(byte_queue.popleft()) for i in range(num_to_pop))))
-            #self.print()
-            if byte_queue:
-                self.print(label_pad, end='')
+        if not byte_queue:
+            return
+
+        # Build the whole table so it goes to the stream in one write
+        prefix = self.get_indent_prefix(self._indent_level)
+        lines = [
+            ' '.join(_HEX[byte] for byte in byte_queue[line_start:line_start + max_bytes_per_line])
+            for line_start in range(0, len(byte_queue), max_bytes_per_line)
+        ]
+        line_sep = f"\n{prefix}{label_pad}{prefix}"
+        self.write(f"{prefix}{line_sep.join(lines)}\n")
+
+        byte_queue.clear()
+
+
+def pack_glyph_table(glyphs: Sequence[ImageCoreLike], max_width_px: int = 8) -> bytes:
+    """
+    Pack the pixel rows of every glyph into left-aligned bytes.
+
+    The glyphs are stacked on a single scratch sheet which is then
+    encoded once. Packing rows of a 1-bit image as raw bytes aligns
+    them to the left of each byte, so pillow does the work in C instead
+    of shifting pixels into place one at a time. Any non-zero pixel
+    counts as set.
+
+    Only glyphs ``max_width_px`` wide or narrower are supported. A
+    ValueError will be raised for wider glyphs rather than cropping
+    them into wrong sprite data.
+
+    :param glyphs: Imaging cores with 1 byte per pixel.
+    :param max_width_px: The width of the scratch sheet.
+    :return: One byte per row of each glyph, in order.
+    """
+    glyph_sizes = [glyph.size for glyph in glyphs]
+    for index, (glyph_width, _) in enumerate(glyph_sizes):
+        if glyph_width > max_width_px:
+            raise ValueError(
+                f"Glyph at index {index} is {glyph_width}px wide, but"
+                f" only glyphs up to {max_width_px}px wide can be packed")
+
+    total_height = sum(height for _, height in glyph_sizes)
+    if total_height == 0:
+        return b''
+
+    sheet = Image.new('L', (max_width_px, total_height), 0)
+    row = 0
+    for glyph, (glyph_width, glyph_height) in zip(glyphs, glyph_sizes):
+        if glyph_width:
+            sheet.paste(glyph, (0, row, glyph_width, row + glyph_height))
+        row += glyph_height
+
+    return sheet.point(_SET_PIXEL_LUT, '1').tobytes()
 
 
 def emit_octo(
     out_file,
     font_data: RasterFont,
-    glyph_sequence: Optional[Iterable[int]] = None
+    glyph_sequence: Optional[Iterable[str]] = None
 ):
 
     # if glyphs is None:
@@ -100,6 +194,13 @@ def emit_octo(
 
     font_width, font_height = font_data.max_glyph_size
     glyph_sequence = tuple(glyph_sequence or font_data.provided_glyphs)
+
+    # The placeholder glyph isn't sized for the tables, so don't use it
+    provided_glyphs = font_data.provided_glyphs
+    missing_glyphs = [glyph for glyph in glyph_sequence if glyph not in provided_glyphs]
+    if missing_glyphs:
+        exit_error(f"Font does not provide requested glyphs: {''.join(missing_glyphs)!r}")
+
     first_glyph = glyph_sequence[0]
     last_glyph = glyph_sequence[-1]
 
@@ -117,132 +218,77 @@ def emit_octo(
     # Make code shorter by tearing off the instance methods and
     # turning them into local funcs. Annoys linters.
     print = octo.print
-    comment = octo.comment
-    label = octo.label
     pad_for_label = octo.pad_for_label_name
-    multi_statement_line = octo.multi_statement_line
-    begin_indented_func = octo.begin_indented_func
-    end_indented_func = octo.end_indented_func
 
     compact_glyphtable = True
 
     kern_px = 1
 
-    draw_char_reg = "v0"
+    char_reg = "v0"
     draw_x_reg = "v1"
     draw_y_reg = "v2"
 
-    width_char_reg = "v0"
-
     prefix = "smallfont"
 
     offset = ord(first_glyph)
 
     # generate label names
-    draw_func_name = prefix + "_draw_glyph"
-    width_func_name = prefix + "_glyph_width"
     widthtable_name = prefix + "_width_table"
     glyphtable_name = prefix + "_glyph_table"
 
-    # header
-    print()
-    #available_chars = ''.join(chr(i) if i in glyphs else '' for i in range(255))
-    available_chars = ''.join(i for i in font_data.provided_glyphs)
-    print(f"# Font: {prefix}  Table glyphs in order: {available_chars}")
-
-    # generate glyph drawing routine
-    print()
-    comment(f"Call with {draw_char_reg} = ASCII character, {draw_x_reg} = x, {draw_y_reg} = y")
-    comment(f"Returns with {draw_x_reg} incremented by the width of the glyph plus {kern_px}")
-    comment(f"Clobbers vF, I{'' if draw_char_reg == width_char_reg else ', ' + width_char_reg}")
-    comment(f"Must not be called with {draw_char_reg} < {first_glyph} or {draw_char_reg} > {last_glyph}!")
-
-    begin_indented_func(draw_func_name)
-    print(f"{draw_char_reg} += {256 - offset}")
-    print(f"i := {glyphtable_name}")
-
-    # for i in range(font_y):
-
-    n_shift = int(log(font_height, 2))
-    remainder = font_height - int(pow(n_shift, 2))
+    # Multiply by the largest power of 2 <= font_height via shifts
+    n_shift = font_height.bit_length() - 1
+    remainder = font_height - (1 << n_shift)
 
     if (n_shift * 2 + remainder + 1) >= font_height:
         n_shift = 0
         remainder = font_height
 
+    glyph_offset_statements = []
+    if remainder:
+        glyph_offset_statements.append([f"i += {char_reg}"] * remainder)
     if n_shift > 0:
-        multi_statement_line([f"i += {draw_char_reg}"] * remainder)
-        multi_statement_line([f"{draw_char_reg} <<= {draw_char_reg}"] * n_shift)
-        print(f"i += {draw_char_reg}")
-        multi_statement_line([f"{draw_char_reg} >>= {draw_char_reg}"] * n_shift)
-
-    else:
-        multi_statement_line([f"i += {draw_char_reg}"] * remainder)
-
-    print(f"sprite {draw_x_reg} {draw_y_reg} {font_height}")
-
-    if draw_char_reg != width_char_reg:
-        print(f"{width_char_reg} := {draw_char_reg}")
-
-    print(f"{width_func_name}_no_offset")
-    print(f"{draw_x_reg} += {width_char_reg}")
-    print(f"{draw_x_reg} += 1")
-
-    end_indented_func()
-
-    # returns width of a particular glyph
-    print()
-    comment(f"Call with {width_char_reg} = ASCII character")
-    comment(f"Returns {width_char_reg} = width of glyph in pixels")
-    comment(f"Clobbers vF, I")
-    comment(f"Must not be called with {width_char_reg} < {first_glyph} or {width_char_reg} > {last_glyph}!")
-
-    label(width_func_name)
-    octo.indent_level += 1
-
-    # todo check if this is a bug? no return
-    print(f"{width_char_reg} += {256 - offset}")
-    octo.indent_level -= 1
-
-    begin_indented_func(f"{width_func_name}_no_offset")
-
-    print(f"i := {widthtable_name}")
-    print(f"i += {width_char_reg}")
-    print(f"load {width_char_reg}")
-    end_indented_func()
-
-    # string drawing routine
-    label(f"{prefix}draw_str")
+        glyph_offset_statements.extend((
+            [f"{char_reg} <<= {char_reg}"] * n_shift,
+            [f"i += {char_reg}"],
+            [f"{char_reg} >>= {char_reg}"] * n_shift,
+        ))
+
+    # Only the values above vary between fonts, so the routines are
+    # filled into a template and written all at once.
+    indent = octo.get_indent_prefix(1)
+    indent_chars = octo.indent_chars
+    octo.write(_PREAMBLE_TEMPLATE.format(
+        comment=octo.comment_prefix,
+        indent=indent,
+        prefix=prefix,
+        available_chars=''.join(glyph_sequence),
+        first_glyph=first_glyph,
+        last_glyph=last_glyph,
+        kern_px=kern_px,
+        font_height=font_height,
+        glyph_offset=256 - offset,
+        char_reg=char_reg,
+        draw_x_reg=draw_x_reg,
+        draw_y_reg=draw_y_reg,
+        glyph_offset_lines=''.join(f"{indent}{indent_chars.join(line)}\n" for line in glyph_offset_statements),
+        widthtable_name=widthtable_name,
+        glyphtable_name=glyphtable_name,
+    ))
 
     # calculate and output the width table
-    for glyph, glyph_img in font_data.glyph_table.items():
-        glyph_width = font_data.get_glyph_metadata(glyph).glyph_bbox.size[0]
-        octo.byte_queue.append(glyph_width)
+    get_glyph_metadata = font_data.get_glyph_metadata
+    octo.queue_data([get_glyph_metadata(glyph).glyph_bbox.width for glyph in glyph_sequence])
     octo.write_queued_data_with_label(widthtable_name)
 
     # calculate and output the glyph data
-    for glyph_code, glyph in font_data.glyph_table.items():
-        glyph_width, glyph_height = font_data.get_glyph_metadata(glyph_code).glyph_bbox.size
-        pixels = bytes(glyph)
-
-        if not compact_glyphtable:
+    if not compact_glyphtable:
+        for glyph_code in glyph_sequence:
             print()
             pad = pad_for_label(widthtable_name)
             print(f" {pad}# {glyph_code} \'{chr(glyph_code)}\': gl{glyph_code}  {pad}", end='')
 
-        # only supports up to eight right now
-        char_size = 8
-        for row_start_index in range(0, len(pixels), glyph_width):
-            pixels_from_image = pixels[row_start_index:row_start_index + glyph_width]
-            packed_row_data = 0
-
-            # use the binary mask to pad the
-            for pixel in pixels_from_image:
-                packed_row_data = (packed_row_data << 1) | (1 if pixel else 0)
-
-            # align to the left
-            packed_row_data <<= char_size - glyph_width
-
-            octo.byte_queue.append(packed_row_data)
+    get_glyph = font_data.get_glyph
+    octo.queue_data(pack_glyph_table([get_glyph(glyph, strict=True) for glyph in glyph_sequence]))
 
     octo.write_queued_data_with_label(glyphtable_name)
@@ -215,3 +215,26 @@ def test_bbox_or_stretches_bboxes_correctly(bboxes_of_mixed_types, expected_bbox
         current |= bbox
     assert current == expected_bbox_or_result
 
+
+def test_bbox_fancy_not_equal_to_wrong_length_args(bbox_fancy_for_valid_args, bad_args_of_wrong_length):
+    assert bbox_fancy_for_valid_args != bad_args_of_wrong_length
+    assert not bbox_fancy_for_valid_args == bad_args_of_wrong_length
+
+
+def test_bbox_fancy_not_equal_compares_as_tuple(
+    bbox_fancy_for_valid_args,
+    tuple_equivalent_to_bbox_for_valid_args
+):
+    assert not bbox_fancy_for_valid_args != list(tuple_equivalent_to_bbox_for_valid_args)
+
+
+def test_bbox_fancy_from_four_ints_matches_constructor(bbox_fancy_for_valid_args):
+    fast = BboxFancy._from_four_ints(*bbox_fancy_for_valid_args)
+    assert type(fast) is BboxFancy
+    assert fast == bbox_fancy_for_valid_args
+    assert fast.size == bbox_fancy_for_valid_args.size
+
+
+def test_bbox_fancy_from_four_ints_rejects_negative_values(bad_args_containing_negatives):
+    with pytest.raises(ValueError):
+        BboxFancy._from_four_ints(*bad_args_containing_negatives)
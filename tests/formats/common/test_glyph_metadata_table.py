@@ -0,0 +1,48 @@
+import pytest
+
+from fontknife.custom_types import BboxFancy, SizeFancy
+from fontknife.formats.common.raster_font import GlyphMetadata, GlyphMetadataTable
+
+
+@pytest.fixture
+def glyph_bboxes():
+    return (
+        (0, 1, 3, 6),
+        (2, 0, 8, 4),
+        (1, 2, 5, 7),
+    )
+
+
+@pytest.fixture
+def glyph_metadata(glyph_bboxes):
+    return [
+        GlyphMetadata(
+            bitmap_bbox=None,
+            glyph_bbox=BboxFancy(*bbox),
+            bitmap_size=SizeFancy(bbox[2] - bbox[0], bbox[3] - bbox[1]),
+            bitmap_len_bytes=(bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+        )
+        for bbox in glyph_bboxes
+    ]
+
+
+def test_glyph_metadata_table_empty_by_default():
+    assert len(GlyphMetadataTable()) == 0
+
+
+def test_glyph_metadata_table_columns_match_metadata(glyph_metadata):
+    table = GlyphMetadataTable.from_glyph_metadata(glyph_metadata)
+
+    assert len(table) == len(glyph_metadata)
+    for index, metadata in enumerate(glyph_metadata):
+        glyph_bbox = metadata.glyph_bbox
+        assert (table.left[index], table.top[index], table.right[index], table.bottom[index]) == glyph_bbox
+        assert (table.width[index], table.height[index]) == glyph_bbox.size
+        assert table.bitmap_len_bytes[index] == metadata.bitmap_len_bytes
+
+
+def test_glyph_metadata_table_aggregates(glyph_metadata):
+    table = GlyphMetadataTable.from_glyph_metadata(glyph_metadata)
+
+    assert (min(table.left), min(table.top), max(table.right), max(table.bottom)) == (0, 0, 8, 7)
+    assert sum(table.bitmap_len_bytes) == 15 + 24 + 20
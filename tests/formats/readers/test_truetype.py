@@ -0,0 +1,83 @@
+import io
+import os
+
+import pytest
+
+import fontknife.formats.readers.truetype as truetype
+from fontknife.formats import get_cache
+from fontknife.formats.readers.truetype import TrueTypeReader, load_truetype_cached
+
+
+@pytest.fixture
+def loader_calls():
+    return []
+
+
+@pytest.fixture
+def fake_loader(loader_calls):
+    def loader(source, size):
+        loader_calls.append((source, size))
+        return object()
+    return loader
+
+
+@pytest.fixture
+def font_file(tmp_path):
+    path = tmp_path / 'font.ttf'
+    path.write_bytes(b'not really a ttf')
+    return path
+
+
+@pytest.fixture
+def reader_with_fake_loader(monkeypatch, fake_loader):
+    # Skip rasterizing so the fake loader's return value is never used
+    monkeypatch.setattr(TrueTypeReader, 'wrapped_callable', fake_loader)
+    monkeypatch.setattr(
+        truetype, 'rasterize_font_to_tables',
+        lambda *args, **kwargs: {'glyph_metadata_table': {}, 'glyph_table': {}})
+    return TrueTypeReader(get_cache)
+
+
+@pytest.fixture(autouse=True)
+def clear_truetype_cache():
+    truetype._load_truetype_for_file_state.cache_clear()
+    yield
+    truetype._load_truetype_for_file_state.cache_clear()
+
+
+def test_load_truetype_cached_reuses_face_for_same_file_state(font_file, fake_loader, loader_calls):
+    first = load_truetype_cached(font_file, 8, loader=fake_loader)
+    second = load_truetype_cached(str(font_file), 8, loader=fake_loader)
+    assert first is second
+    assert len(loader_calls) == 1
+
+
+def test_load_truetype_cached_separates_point_sizes(font_file, fake_loader, loader_calls):
+    assert load_truetype_cached(font_file, 8, loader=fake_loader) is not\
+        load_truetype_cached(font_file, 9, loader=fake_loader)
+    assert [size for _, size in loader_calls] == [8, 9]
+
+
+def test_load_truetype_cached_reloads_when_modified_time_changes(font_file, fake_loader, loader_calls):
+    first = load_truetype_cached(font_file, 8, loader=fake_loader)
+
+    modified_time_ns = font_file.stat().st_mtime_ns
+    os.utime(font_file, ns=(modified_time_ns, modified_time_ns + 1_000_000_000))
+
+    second = load_truetype_cached(font_file, 8, loader=fake_loader)
+    assert first is not second
+    assert len(loader_calls) == 2
+
+
+def test_reader_caches_path_sources(reader_with_fake_loader, font_file, loader_calls):
+    reader_with_fake_loader.load_source(font_file, font_size_points=8)
+    reader_with_fake_loader.load_source(font_file, font_size_points=8)
+    assert loader_calls == [(str(font_file.resolve()), 8)]
+
+
+def test_reader_does_not_cache_stdin(reader_with_fake_loader, monkeypatch, loader_calls):
+    monkeypatch.setattr('sys.stdin', io.TextIOWrapper(io.BytesIO(b'not really a ttf')))
+    reader_with_fake_loader.load_source('-', font_size_points=8)
+    reader_with_fake_loader.load_source('-', font_size_points=8)
+    assert len(loader_calls) == 2
+    assert truetype._load_truetype_for_file_state.cache_info().currsize == 0
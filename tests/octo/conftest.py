@@ -0,0 +1,47 @@
+from typing import Dict, Tuple
+
+import pytest
+from PIL import Image
+
+from fontknife.formats import RasterFont
+from fontknife.formats.common.raster_font import GlyphMetadata
+
+
+# Glyph rows as strings of '#' for set pixels and '.' for empty ones
+_SYNTHETIC_GLYPHS: Dict[str, Tuple[str, ...]] = {
+    'A': ('.#.', '#.#', '###', '#.#', '#.#'),
+    'B': ('##.', '#.#', '##.', '#.#', '##.'),
+    'C': ('.##', '#..', '#..', '#..', '.##'),
+    'D': ('##..', '#.#.', '#..#', '#.#.', '##..'),
+}
+
+# Non-zero glyph bbox offsets keep RasterFont's placeholder glyph
+# large enough to draw.
+_GLYPH_BBOX_OFFSET = 3
+
+
+def make_synthetic_font(glyphs: Dict[str, Tuple[str, ...]]) -> RasterFont:
+    glyph_table = {}
+    glyph_metadata_table = {}
+    offset = _GLYPH_BBOX_OFFSET
+
+    for glyph, rows in glyphs.items():
+        width, height = len(rows[0]), len(rows)
+        pixels = bytes(255 if pixel == '#' else 0 for row in rows for pixel in row)
+        core = Image.frombytes('L', (width, height), pixels).im
+
+        glyph_table[glyph] = core
+        glyph_metadata_table[glyph] = GlyphMetadata.from_font_glyph(
+            (offset, offset, offset + width, offset + height), core)
+
+    return RasterFont(glyph_table=glyph_table, glyph_metadata_table=glyph_metadata_table)
+
+
+@pytest.fixture
+def synthetic_font() -> RasterFont:
+    return make_synthetic_font(_SYNTHETIC_GLYPHS)
+
+
+@pytest.fixture
+def tall_synthetic_font() -> RasterFont:
+    return make_synthetic_font({'|': ('#',) * 8})
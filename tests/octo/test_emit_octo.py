@@ -0,0 +1,109 @@
+from io import StringIO
+
+import pytest
+
+from fontknife.octo import emit_octo
+
+
+# Octo output for the synthetic font fixtures. Update these only when
+# an intentional change is made to emit_octo's output.
+EXPECTED_SYNTHETIC_FONT_OUTPUT = """
+# Font: smallfont  Table glyphs in order: ABCD
+
+# Call with v0 = ASCII character, v1 = x, v2 = y
+# Returns with v1 incremented by the width of the glyph plus 1
+# Clobbers vF, I
+# Must not be called with v0 < A or v0 > D!
+: smallfont_draw_glyph
+  v0 += 191
+  i := smallfont_glyph_table
+  i += v0  i += v0  i += v0  i += v0  i += v0
+  sprite v1 v2 5
+  smallfont_glyph_width_no_offset
+  v1 += v0
+  v1 += 1
+  return
+
+# Call with v0 = ASCII character
+# Returns v0 = width of glyph in pixels
+# Clobbers vF, I
+# Must not be called with v0 < A or v0 > D!
+: smallfont_glyph_width
+  v0 += 191
+: smallfont_glyph_width_no_offset
+  i := smallfont_width_table
+  i += v0
+  load v0
+  return
+: smallfontdraw_str
+: smallfont_width_table 0x03 0x03 0x03 0x04
+: smallfont_glyph_table 0x40 0xA0 0xE0 0xA0 0xA0 0xC0 0xA0 0xC0 0xA0 0xC0 0x60 0x80 0x80 0x80 0x60 0xC0
+                        0xA0 0x90 0xA0 0xC0
+"""
+
+EXPECTED_TALL_SYNTHETIC_FONT_OUTPUT = """
+# Font: smallfont  Table glyphs in order: |
+
+# Call with v0 = ASCII character, v1 = x, v2 = y
+# Returns with v1 incremented by the width of the glyph plus 1
+# Clobbers vF, I
+# Must not be called with v0 < | or v0 > |!
+: smallfont_draw_glyph
+  v0 += 132
+  i := smallfont_glyph_table
+  v0 <<= v0  v0 <<= v0  v0 <<= v0
+  i += v0
+  v0 >>= v0  v0 >>= v0  v0 >>= v0
+  sprite v1 v2 8
+  smallfont_glyph_width_no_offset
+  v1 += v0
+  v1 += 1
+  return
+
+# Call with v0 = ASCII character
+# Returns v0 = width of glyph in pixels
+# Clobbers vF, I
+# Must not be called with v0 < | or v0 > |!
+: smallfont_glyph_width
+  v0 += 132
+: smallfont_glyph_width_no_offset
+  i := smallfont_width_table
+  i += v0
+  load v0
+  return
+: smallfontdraw_str
+: smallfont_width_table 0x01
+: smallfont_glyph_table 0x80 0x80 0x80 0x80 0x80 0x80 0x80 0x80
+"""
+
+
+def emit_octo_lines(font, glyph_sequence=None):
+    output = StringIO()
+    emit_octo(output, font, glyph_sequence=glyph_sequence)
+    return output.getvalue().splitlines()
+
+
+def test_emit_octo_glyph_sequence_orders_header_and_tables(synthetic_font):
+    lines = emit_octo_lines(synthetic_font, glyph_sequence='CAB')
+
+    assert lines[1] == "# Font: smallfont  Table glyphs in order: CAB"
+    assert lines[-2:] == [
+        ": smallfont_width_table 0x03 0x03 0x03",
+        ": smallfont_glyph_table 0x60 0x80 0x80 0x80 0x60 0x40 0xA0 0xE0 0xA0 0xA0 0xC0 0xA0 0xC0 0xA0 0xC0",
+    ]
+
+def test_emit_octo_exits_on_glyphs_missing_from_font(synthetic_font):
+    with pytest.raises(SystemExit):
+        emit_octo_lines(synthetic_font, glyph_sequence='ABéD')
+
+
+def test_emit_octo_output_matches_expected(synthetic_font):
+    output = StringIO()
+    emit_octo(output, synthetic_font)
+    assert output.getvalue() == EXPECTED_SYNTHETIC_FONT_OUTPUT
+
+
+def test_emit_octo_output_matches_expected_for_shifted_offsets(tall_synthetic_font):
+    output = StringIO()
+    emit_octo(output, tall_synthetic_font)
+    assert output.getvalue() == EXPECTED_TALL_SYNTHETIC_FONT_OUTPUT
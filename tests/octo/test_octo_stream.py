@@ -0,0 +1,34 @@
+from io import StringIO
+
+import pytest
+
+from fontknife.octo import OctoStream
+
+
+@pytest.fixture
+def octo_stream_and_output():
+    output = StringIO()
+    return OctoStream(output), output
+
+
+def test_get_indent_prefix_uses_level_argument(octo_stream_and_output):
+    octo, _ = octo_stream_and_output
+    octo.indent_level = 3
+    assert octo.get_indent_prefix(1) == "  "
+    assert octo.get_indent_prefix(0) == ""
+
+
+def test_print_indents_to_current_level(octo_stream_and_output):
+    octo, output = octo_stream_and_output
+    for level in (0, 2, 1, 0):
+        octo.indent_level = level
+        octo.print("return")
+    assert output.getvalue() == "return\n    return\n  return\nreturn\n"
+
+
+def test_write_queued_data_with_label_wraps_and_clears_queue(octo_stream_and_output):
+    octo, output = octo_stream_and_output
+    octo.queue_data(range(5))
+    octo.write_queued_data_with_label("t", max_bytes_per_line=2)
+    assert output.getvalue() == ": t 0x00 0x01\n    0x02 0x03\n    0x04\n"
+    assert not octo.byte_queue
@@ -0,0 +1,99 @@
+import pytest
+from PIL import Image
+
+from fontknife.octo import pack_glyph_table
+
+
+def l_core(width, height, values):
+    return Image.frombytes('L', (width, height), bytes(values)).im
+
+
+def reference_packed_rows(glyph, char_size=8):
+    """
+    The per-pixel packing emit_octo originally used, for comparison.
+    """
+    width, height = glyph.size
+    pixels = bytes(glyph)
+    packed = bytearray()
+    for row_start in range(0, width * height, width):
+        packed_row_data = 0
+        for pixel in pixels[row_start:row_start + width]:
+            packed_row_data = (packed_row_data << 1) | (1 if pixel else 0)
+        packed.append(packed_row_data << (char_size - width))
+    return bytes(packed)
+
+
+@pytest.fixture(params=('1', 'L'))
+def core_mode(request):
+    return request.param
+
+
+@pytest.fixture(params=((1, 1), (3, 5), (5, 2), (7, 7), (8, 8)))
+def core_size(request):
+    return request.param
+
+
+@pytest.fixture
+def patterned_core(core_mode, core_size):
+    width, height = core_size
+    image = Image.frombytes('L', core_size, bytes(
+        (0, 1, 0, 7, 255, 0, 0, 128)[(x * 3 + y) % 8] for y in range(height) for x in range(width)))
+    if core_mode == '1':
+        image = image.point(lambda p: 255 if p else 0, '1')
+    return image.im
+
+
+def test_pack_glyph_table_matches_per_pixel_packing(patterned_core):
+    assert pack_glyph_table((patterned_core,)) == reference_packed_rows(patterned_core)
+
+
+@pytest.fixture(params=(1, 7, 255))
+def non_zero_value(request):
+    return request.param
+
+
+def test_pack_glyph_table_treats_any_non_zero_value_as_set(non_zero_value):
+    glyph = l_core(3, 2, (non_zero_value, 0, 0, 0, 0, non_zero_value))
+    assert pack_glyph_table((glyph,)) == bytes((0b10000000, 0b00100000))
+
+
+def test_pack_glyph_table_zero_width_glyph_emits_empty_rows():
+    assert pack_glyph_table((Image.new('L', (0, 3)).im,)) == bytes(3)
+
+
+def test_pack_glyph_table_zero_height_glyph_emits_nothing():
+    assert pack_glyph_table((Image.new('L', (4, 0)).im,)) == b''
+
+
+def test_pack_glyph_table_empty_sequence_emits_nothing():
+    assert pack_glyph_table(()) == b''
+
+
+def test_pack_glyph_table_stacks_glyphs_of_different_heights():
+    glyphs = (
+        l_core(2, 1, (255, 255)),
+        Image.new('L', (0, 2)).im,
+        l_core(8, 3, (1, 0, 0, 0, 0, 0, 0, 7) * 3),
+        Image.new('L', (5, 0)).im,
+        Image.new('1', (4, 2), 255).im,
+    )
+    assert pack_glyph_table(glyphs) == bytes((
+        0b11000000,
+        0, 0,
+        0b10000001, 0b10000001, 0b10000001,
+        0b11110000, 0b11110000,
+    ))
+
+
+@pytest.fixture(params=(9, 16))
+def over_width_px(request):
+    return request.param
+
+
+def test_pack_glyph_table_rejects_over_width_glyphs(over_width_px):
+    glyphs = (
+        l_core(3, 1, (255, 0, 255)),
+        Image.new('1', (over_width_px, 2), 255).im,
+    )
+    with pytest.raises(ValueError):
+        pack_glyph_table(glyphs)